@@ -1,30 +1,53 @@
+import asyncio
 import logging
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import boto3
+import botocore
 import neo4j
+from botocore.exceptions import ClientError
 
 from cartography.client.core.tx import load
 from cartography.graph.job import GraphJob
 from cartography.models.aws.sns.topic import SNSTopicSchema
 from cartography.stats import get_stats_client
 from cartography.util import aws_handle_regions
+from cartography.util import is_throttling_exception
 from cartography.util import merge_module_sync_metadata
 from cartography.util import timeit
+from cartography.util import to_asynchronous
+from cartography.util import to_synchronous
 
 logger = logging.getLogger(__name__)
 stat_handler = get_stats_client(__name__)
 
+# Attributes returned by GetTopicAttributes that we ingest, split by how they are transformed.
+_TOPIC_STRING_ATTRIBUTES = (
+    "DisplayName",
+    "Owner",
+    "DeliveryPolicy",
+    "EffectiveDeliveryPolicy",
+    "KmsMasterKeyId",
+)
+_TOPIC_COUNT_ATTRIBUTES = (
+    "SubscriptionsPending",
+    "SubscriptionsConfirmed",
+    "SubscriptionsDeleted",
+)
+
+# Errors that are common when the sync role is denied access to individual topics; these are not worth a warning.
+_EXPECTED_TOPIC_ATTRIBUTES_ERROR_CODES = ("AuthorizationError", "AccessDenied")
+
 
 @timeit
 @aws_handle_regions
-def get_sns_topics(boto3_session: boto3.session.Session, region: str) -> List[Dict]:
+def get_sns_topics(client: botocore.client.BaseClient) -> List[Dict]:
     """
-    Get all SNS Topics for a region.
+    Get all SNS Topics for the region of the given SNS client.
     """
-    client = boto3_session.client("sns", region_name=region)
     paginator = client.get_paginator("list_topics")
     topics = []
     for page in paginator.paginate():
@@ -35,19 +58,50 @@ def get_sns_topics(boto3_session: boto3.session.Session, region: str) -> List[Di
 
 @timeit
 def get_topic_attributes(
-    boto3_session: boto3.session.Session, topic_arn: str, region: str
+    client: botocore.client.BaseClient, topic_arn: str
 ) -> Optional[Dict]:
     """
     Get attributes for an SNS Topic.
     """
-    client = boto3_session.client("sns", region_name=region)
     try:
         return client.get_topic_attributes(TopicArn=topic_arn)
-    except Exception as e:
-        logger.warning(f"Error getting attributes for SNS topic {topic_arn}: {e}")
+    except ClientError as e:
+        if is_throttling_exception(e):
+            # Let to_asynchronous() back off and retry
+            raise
+        if e.response["Error"]["Code"] in _EXPECTED_TOPIC_ATTRIBUTES_ERROR_CODES:
+            logger.debug(f"Not authorized to get attributes for SNS topic {topic_arn}")
+        else:
+            logger.warning(f"Error getting attributes for SNS topic {topic_arn}: {e}")
         return None
 
 
+async def _get_topics_and_attributes(
+    boto3_session: boto3.session.Session, region: str
+) -> Tuple[List[Dict], Dict[str, Dict]]:
+    """
+    Get all SNS Topics for a region along with a mapping from TopicArn to the
+    topic's attributes. Attribute calls for a region run concurrently and share
+    one regional SNS client.
+    """
+    # Create the client here, on the event loop thread, and only hand the client to the threadpool: boto3 sessions
+    # are not thread-safe, but clients are.
+    client = boto3_session.client("sns", region_name=region)
+    topics = await to_asynchronous(get_sns_topics, client)
+
+    attributes = await asyncio.gather(
+        *[
+            to_asynchronous(get_topic_attributes, client, topic["TopicArn"])
+            for topic in topics
+        ],
+    )
+
+    topic_attributes = {
+        topic["TopicArn"]: attrs for topic, attrs in zip(topics, attributes) if attrs
+    }
+    return topics, topic_attributes
+
+
 def transform_sns_topics(
     topics: List[Dict], attributes: Dict[str, Dict], region: str
 ) -> List[Dict]:
@@ -60,7 +114,7 @@ def transform_sns_topics(
 
         # Extract topic name from ARN
         # Format: arn:aws:sns:region:account-id:topic-name
-        topic_name = topic_arn.split(":")[-1]
+        topic_name = topic_arn.rpartition(":")[2]
 
         # Get attributes
         topic_attrs = attributes.get(topic_arn, {}).get("Attributes", {})
@@ -68,17 +122,13 @@ def transform_sns_topics(
         transformed_topic = {
             "TopicArn": topic_arn,
             "TopicName": topic_name,
-            "DisplayName": topic_attrs.get("DisplayName", ""),
-            "Owner": topic_attrs.get("Owner", ""),
-            "SubscriptionsPending": int(topic_attrs.get("SubscriptionsPending", "0")),
-            "SubscriptionsConfirmed": int(
-                topic_attrs.get("SubscriptionsConfirmed", "0")
-            ),
-            "SubscriptionsDeleted": int(topic_attrs.get("SubscriptionsDeleted", "0")),
-            "DeliveryPolicy": topic_attrs.get("DeliveryPolicy", ""),
-            "EffectiveDeliveryPolicy": topic_attrs.get("EffectiveDeliveryPolicy", ""),
-            "KmsMasterKeyId": topic_attrs.get("KmsMasterKeyId", ""),
         }
+        # Leave missing attributes as None so that the property is not set on the node
+        for key in _TOPIC_STRING_ATTRIBUTES:
+            transformed_topic[key] = topic_attrs.get(key)
+        for key in _TOPIC_COUNT_ATTRIBUTES:
+            count = topic_attrs.get(key)
+            transformed_topic[key] = int(count) if count is not None else None
 
         transformed_topics.append(transformed_topic)
 
@@ -130,19 +180,16 @@ def sync(
     """
     Sync SNS Topics for all regions
     """
-    for region in regions:
+    # Query all regions concurrently, then write to the graph serially since the
+    # neo4j session is not safe to share across threads.
+    regional_data = to_synchronous(
+        *[_get_topics_and_attributes(boto3_session, region) for region in regions],
+    )
+
+    for region, (topics, topic_attributes) in zip(regions, regional_data):
         logger.info(
             f"Syncing SNS Topics for {region} in account {current_aws_account_id}"
         )
-        topics = get_sns_topics(boto3_session, region)
-
-        topic_attributes = {}
-        for topic in topics:
-            topic_arn = topic["TopicArn"]
-            attrs = get_topic_attributes(boto3_session, topic_arn, region)
-            if attrs:
-                topic_attributes[topic_arn] = attrs
-
         transformed_topics = transform_sns_topics(topics, topic_attributes, region)
 
         load_sns_topics(
@@ -37,6 +37,8 @@ STATUS_SUCCESS = 0
 STATUS_FAILURE = 1
 STATUS_KEYBOARD_INTERRUPT = 130
 DEFAULT_BATCH_SIZE = 1000
+# Maximum number of attempts to_asynchronous() makes when a call keeps getting throttled
+DEFAULT_THROTTLING_MAX_TRIES = 5
 
 
 def run_analysis_job(
@@ -161,13 +163,14 @@ def merge_module_sync_metadata(
             n.lastupdated=$UPDATE_TAG
     """,
     )
-    neo4j_session.run(
-        template.safe_substitute(
-            group_type=group_type,
-            group_id=group_id,
-            synced_type=synced_type,
-        ),
-        UPDATE_TAG=update_tag,
+    query = template.safe_substitute(
+        group_type=group_type,
+        group_id=group_id,
+        synced_type=synced_type,
+    )
+    # Use a managed transaction so that the driver retries this idempotent MERGE on transient errors.
+    neo4j_session.write_transaction(
+        lambda tx: tx.run(query, UPDATE_TAG=update_tag).consume(),
     )
     stat_handler.incr(f"{group_type}_{group_id}_{synced_type}_lastupdated", update_tag)
 
@@ -372,7 +375,12 @@ def is_throttling_exception(exc: Exception) -> bool:
     """
     # https://boto3.amazonaws.com/v1/documentation/api/1.19.9/guide/error-handling.html
     if isinstance(exc, botocore.exceptions.ClientError):
-        if exc.response["Error"]["Code"] in ["LimitExceededException", "Throttling"]:
+        if exc.response["Error"]["Code"] in [
+            "LimitExceededException",
+            "Throttling",
+            # Used by some services, e.g. SNS
+            "Throttled",
+        ]:
             return True
     # add other exceptions here, if needed, like:
     # https://cloud.google.com/python/docs/reference/storage/1.39.0/retry_timeout#configuring-retries
@@ -386,7 +394,8 @@ def to_asynchronous(func: Callable[..., R], *args: Any, **kwargs: Any) -> Awaita
     Returns a Future that will run a function and its arguments in the default threadpool.
     Helper until we start using python 3.9's asyncio.to_thread
 
-    Calls are also wrapped within a backoff decorator to handle throttling errors.
+    Calls are also wrapped within a backoff decorator to handle throttling errors, giving up after
+    DEFAULT_THROTTLING_MAX_TRIES attempts.
 
     :param func: the function to be wrapped by the Future
     :param args: a series of arguments to be passed into func
@@ -429,7 +438,11 @@ def to_asynchronous(func: Callable[..., R], *args: Any, **kwargs: Any) -> Awaita
             raise
 
     # don't use @backoff as decorator, to preserve typing
-    wrapped = backoff.on_exception(backoff.expo, CartographyThrottlingException)(
+    wrapped = backoff.on_exception(
+        backoff.expo,
+        CartographyThrottlingException,
+        max_tries=DEFAULT_THROTTLING_MAX_TRIES,
+    )(
         wrapper,
     )
     call = partial(wrapped, *args, **kwargs)
@@ -28,7 +28,7 @@ def check_nodes(
     result = neo4j_session.run(
         query_template.safe_substitute(NodeLabel=node_label, Attrs=attrs),
     )
-    return {tuple(row.values()) for row in result}
+    return {tuple(row) for row in result.values()}
 
 
 def check_rels(
@@ -68,4 +68,4 @@ def check_rels(
         Node2Attr=node_2_attr,
     )
     result = neo4j_session.run(query)
-    return {(r[f"n1.{node_1_attr}"], r[f"n2.{node_2_attr}"]) for r in result}
+    return {tuple(row) for row in result.values()}
@@ -0,0 +1,225 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from cartography.intel.aws.sns import _get_topics_and_attributes
+from cartography.intel.aws.sns import cleanup_sns
+from cartography.intel.aws.sns import get_sns_topics
+from cartography.intel.aws.sns import get_topic_attributes
+from cartography.intel.aws.sns import transform_sns_topics
+from cartography.util import DEFAULT_THROTTLING_MAX_TRIES
+from cartography.util import to_synchronous
+from tests.data.aws.sns import GET_TOPIC_ATTRIBUTES
+from tests.data.aws.sns import LIST_TOPICS
+
+TEST_ACCOUNT_ID = "123456789012"
+TEST_TOPIC_ARN = "arn:aws:sns:us-east-1:123456789012:test-topic"
+
+
+@pytest.mark.parametrize(
+    "pages",
+    [
+        [],
+        [{"Topics": []}],
+        [LIST_TOPICS],
+        [{"Topics": [{"TopicArn": f"{TEST_TOPIC_ARN}-{i}"}]} for i in range(100)],
+        # Pages without a Topics key are skipped
+        [LIST_TOPICS, {}],
+    ],
+)
+def test_get_sns_topics(pages):
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = pages
+
+    result = get_sns_topics(mock_client)
+
+    assert result == [topic for page in pages for topic in page.get("Topics", [])]
+    mock_client.get_paginator.assert_called_once_with("list_topics")
+
+
+def test_transform_sns_topics():
+    result = transform_sns_topics(
+        LIST_TOPICS["Topics"],
+        {TEST_TOPIC_ARN: GET_TOPIC_ATTRIBUTES},
+        "us-east-1",
+    )
+
+    assert result == [
+        {
+            "TopicArn": TEST_TOPIC_ARN,
+            "TopicName": "test-topic",
+            "DisplayName": "Test Topic",
+            "Owner": "123456789012",
+            "SubscriptionsPending": 0,
+            "SubscriptionsConfirmed": 1,
+            "SubscriptionsDeleted": 0,
+            "DeliveryPolicy": "{}",
+            "EffectiveDeliveryPolicy": "{}",
+            "KmsMasterKeyId": "arn:aws:kms:us-east-1:123456789012:key/test-key",
+        },
+    ]
+
+
+def test_transform_sns_topics_missing_attributes():
+    # Attributes we could not fetch are left as None rather than written as empty values
+    result = transform_sns_topics(LIST_TOPICS["Topics"], {}, "us-east-1")
+
+    assert result == [
+        {
+            "TopicArn": TEST_TOPIC_ARN,
+            "TopicName": "test-topic",
+            "DisplayName": None,
+            "Owner": None,
+            "SubscriptionsPending": None,
+            "SubscriptionsConfirmed": None,
+            "SubscriptionsDeleted": None,
+            "DeliveryPolicy": None,
+            "EffectiveDeliveryPolicy": None,
+            "KmsMasterKeyId": None,
+        },
+    ]
+
+
+def _client_error(code):
+    return ClientError(
+        error_response={"Error": {"Code": code, "Message": code}},
+        operation_name="GetTopicAttributes",
+    )
+
+
+def test_get_topic_attributes():
+    mock_client = MagicMock()
+    mock_client.get_topic_attributes.return_value = GET_TOPIC_ATTRIBUTES
+
+    assert get_topic_attributes(mock_client, TEST_TOPIC_ARN) == GET_TOPIC_ATTRIBUTES
+    mock_client.get_topic_attributes.assert_called_once_with(TopicArn=TEST_TOPIC_ARN)
+
+
+@pytest.mark.parametrize("code", ["AuthorizationError", "AccessDenied", "NotFound"])
+def test_get_topic_attributes_client_error(code):
+    mock_client = MagicMock()
+    mock_client.get_topic_attributes.side_effect = _client_error(code)
+
+    assert get_topic_attributes(mock_client, TEST_TOPIC_ARN) is None
+
+
+@pytest.mark.parametrize("code", ["Throttled", "Throttling"])
+def test_get_topic_attributes_throttling_is_raised(code):
+    # Throttling must propagate so that to_asynchronous() can back off and retry the call
+    mock_client = MagicMock()
+    mock_client.get_topic_attributes.side_effect = _client_error(code)
+
+    with pytest.raises(ClientError):
+        get_topic_attributes(mock_client, TEST_TOPIC_ARN)
+
+
+@patch("time.sleep")
+def test_get_topics_and_attributes_retries_throttling(mock_sleep):
+    boto3_session = MagicMock()
+    client = boto3_session.client.return_value
+    client.get_paginator.return_value.paginate.return_value = [LIST_TOPICS]
+    client.get_topic_attributes.side_effect = [
+        _client_error("Throttled"),
+        GET_TOPIC_ATTRIBUTES,
+    ]
+
+    [(topics, topic_attributes)] = to_synchronous(
+        _get_topics_and_attributes(boto3_session, "us-east-1"),
+    )
+
+    assert topic_attributes == {TEST_TOPIC_ARN: GET_TOPIC_ATTRIBUTES}
+    assert client.get_topic_attributes.call_count == 2
+
+
+@patch("time.sleep")
+def test_get_topics_and_attributes_throttling_gives_up(mock_sleep):
+    # A topic that stays throttled is not retried forever
+    boto3_session = MagicMock()
+    client = boto3_session.client.return_value
+    client.get_paginator.return_value.paginate.return_value = [LIST_TOPICS]
+    client.get_topic_attributes.side_effect = _client_error("Throttled")
+
+    with pytest.raises(Exception) as excinfo:
+        to_synchronous(_get_topics_and_attributes(boto3_session, "us-east-1"))
+
+    assert isinstance(excinfo.value.__cause__, ClientError)
+    assert client.get_topic_attributes.call_count == DEFAULT_THROTTLING_MAX_TRIES
+
+
+def _mock_regional_client(region, denied_topic_arns=()):
+    """
+    Returns a mock SNS client listing two topics in the given region, where GetTopicAttributes is denied for the ARNs
+    in `denied_topic_arns`.
+    """
+    topic_arns = [f"arn:aws:sns:{region}:{TEST_ACCOUNT_ID}:topic-{i}" for i in range(2)]
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Topics": [{"TopicArn": arn} for arn in topic_arns]},
+    ]
+
+    def get_topic_attributes(TopicArn):
+        if TopicArn in denied_topic_arns:
+            raise _client_error("AuthorizationError")
+        return {"Attributes": {"TopicArn": TopicArn}}
+
+    client.get_topic_attributes.side_effect = get_topic_attributes
+    return client, topic_arns
+
+
+def test_get_topics_and_attributes():
+    denied_arn = f"arn:aws:sns:us-east-1:{TEST_ACCOUNT_ID}:topic-1"
+    client, topic_arns = _mock_regional_client("us-east-1", {denied_arn})
+    boto3_session = MagicMock()
+    boto3_session.client.return_value = client
+
+    [(topics, topic_attributes)] = to_synchronous(
+        _get_topics_and_attributes(boto3_session, "us-east-1"),
+    )
+
+    assert topics == [{"TopicArn": arn} for arn in topic_arns]
+    # The topic whose attributes could not be fetched is left out of the mapping
+    assert topic_attributes == {
+        topic_arns[0]: {"Attributes": {"TopicArn": topic_arns[0]}},
+    }
+    # One client per region is shared by the topic listing and all attribute calls
+    boto3_session.client.assert_called_once_with("sns", region_name="us-east-1")
+    assert client.get_topic_attributes.call_count == 2
+
+
+def test_get_topics_and_attributes_multiple_regions():
+    regions = ["us-east-1", "us-west-2", "eu-west-1"]
+    clients = {}
+    topic_arns_by_region = {}
+    for region in regions:
+        clients[region], topic_arns_by_region[region] = _mock_regional_client(region)
+    boto3_session = MagicMock()
+    boto3_session.client.side_effect = lambda _, region_name: clients[region_name]
+
+    regional_data = to_synchronous(
+        *[_get_topics_and_attributes(boto3_session, region) for region in regions],
+    )
+
+    # Results come back in the order of the regions so sync() can zip them together
+    for region, (topics, topic_attributes) in zip(regions, regional_data):
+        topic_arns = topic_arns_by_region[region]
+        assert topics == [{"TopicArn": arn} for arn in topic_arns]
+        assert set(topic_attributes) == set(topic_arns)
+    assert boto3_session.client.call_count == len(regions)
+
+
+def test_cleanup_sns():
+    neo4j_session = MagicMock()
+    tx = MagicMock()
+    neo4j_session.write_transaction.side_effect = lambda tx_func: tx_func(tx)
+    # Report no updates so that each iterative cleanup statement runs only once
+    tx.run.return_value.consume.return_value.counters.contains_updates = False
+
+    cleanup_sns(neo4j_session, {"UPDATE_TAG": 1, "AWS_ID": TEST_ACCOUNT_ID})
+
+    queries = [call.args[0] for call in tx.run.call_args_list]
+    [node_cleanup_query] = [q for q in queries if "DETACH DELETE" in q]
+    # Only stale topics belonging to the account being synced are deleted
+    assert "(n:SNSTopic)<-[s:RESOURCE]-(:AWSAccount{id: $AWS_ID})" in node_cleanup_query
+    assert "n.lastupdated <> $UPDATE_TAG" in node_cleanup_query
@@ -9,6 +9,7 @@ import cartography.util
 from cartography import util
 from cartography.util import aws_handle_regions
 from cartography.util import batch
+from cartography.util import is_throttling_exception
 from cartography.util import run_analysis_and_ensure_deps
 
 
@@ -111,6 +112,24 @@ def test_batch(mocker):
     assert batch([], 3) == []
 
 
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("LimitExceededException", True),
+        ("Throttling", True),
+        ("Throttled", True),
+        ("AccessDenied", False),
+    ],
+)
+def test_is_throttling_exception(code, expected):
+    exc = botocore.exceptions.ClientError(
+        error_response={"Error": {"Code": code, "Message": code}},
+        operation_name="TestOperation",
+    )
+
+    assert is_throttling_exception(exc) is expected
+
+
 @mock.patch.object(cartography.util, "run_analysis_job", return_value=None)
 def test_run_analysis_and_ensure_deps(mock_run_analysis_job: mock.MagicMock):
     # Arrange